@@ -1,6 +1,7 @@
 """Streamlit chat interface for the HR RAG Chatbot."""
 
 import sys
+import uuid
 from pathlib import Path
 
 # Add project root to path
@@ -8,7 +9,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import streamlit as st
 
-from src.generation import ask_with_sources
+from src.generation import ask_in_session
 from src.retrieval import get_index_stats
 
 # Page config
@@ -50,6 +51,8 @@ with st.sidebar:
 # Initialize chat history
 if "messages" not in st.session_state:
     st.session_state.messages = []
+if "session_id" not in st.session_state:
+    st.session_state.session_id = str(uuid.uuid4())
 
 # Display chat history
 for message in st.session_state.messages:
@@ -59,6 +62,8 @@ for message in st.session_state.messages:
             with st.expander("📚 Sources"):
                 for source in message["sources"]:
                     st.markdown(f"**{source['filename']}** ({source['category']})")
+                    if source.get("also_in"):
+                        st.caption("Also in: " + ", ".join(source["also_in"]))
                     st.caption(source["excerpt"])
 
 # Chat input
@@ -74,17 +79,21 @@ if prompt := st.chat_input("Ask an HR question..."):
     with st.chat_message("assistant"):
         with st.spinner("Searching HR documents..."):
             try:
-                result = ask_with_sources(prompt)
+                result = ask_in_session(st.session_state.session_id, prompt)
                 response = result["answer"]
                 sources = result["sources"]
 
                 st.markdown(response)
+                if result.get("answered_by") == "extractive":
+                    st.caption("⚡ Quoted directly from the HR documents")
 
                 # Show sources
                 if sources:
                     with st.expander("📚 Sources"):
                         for source in sources:
                             st.markdown(f"**{source['filename']}** ({source['category']})")
+                            if source.get("also_in"):
+                                st.caption("Also in: " + ", ".join(source["also_in"]))
                             st.caption(source["excerpt"])
 
                 # Add to history
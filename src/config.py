@@ -12,18 +12,64 @@ PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 RAW_DATA_DIR = DATA_DIR / "raw"
 PROCESSED_DATA_DIR = DATA_DIR / "processed"
+BENCHMARK_FILE = DATA_DIR / "benchmark" / "questions.json"  # [{"question", "expected_source"}]
 CHROMA_DB_DIR = PROJECT_ROOT / "chroma_db"
 
 # Embedding settings (local sentence-transformers)
 LOCAL_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 
+# Embedding backend: "torch" (sentence-transformers) or "onnx" (onnxruntime)
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch")
+ONNX_MODEL_DIR = PROJECT_ROOT / "models" / LOCAL_EMBEDDING_MODEL
+ONNX_QUANTIZED = os.getenv("ONNX_QUANTIZED", "false").lower() == "true"
+ONNX_NUM_THREADS = int(os.getenv("ONNX_NUM_THREADS", "0"))  # 0 = onnxruntime default
+ONNX_MAX_SEQ_LENGTH = 256  # tokens, matches all-MiniLM-L6-v2
+EMBEDDING_BATCH_SIZE = 32  # documents per batch when indexing
+QUERY_BATCH_SIZE = 16  # max concurrent queries encoded together
+QUERY_BATCH_WAIT_MS = 2  # how long to wait for other queries to join a batch
+
 # Chunking settings
 CHUNK_SIZE = 1000  # characters
 CHUNK_OVERLAP = 200  # characters
 
+# Near-duplicate chunk removal (MinHash + LSH)
+DEDUP_THRESHOLD = 0.85  # estimated Jaccard similarity of word shingles
+DEDUP_SHINGLE_SIZE = 5  # words per shingle
+DEDUP_NUM_PERM = 128  # MinHash signature length
+DEDUP_BANDS = 16  # LSH bands (DEDUP_NUM_PERM must divide evenly)
+
 # Retrieval settings
 TOP_K_RESULTS = 5
 
+# Index versioning (each build writes a new collection, then swaps the pointer)
+COLLECTION_NAME = "hr_documents"
+CURRENT_INDEX_FILE = CHROMA_DB_DIR / "current_index.json"
+INDEX_VERSIONS_TO_KEEP = 3
+INDEX_SMOKE_QUERIES = [
+    "What is the vacation policy?",
+    "What benefits does the company offer?",
+]
+
+# Extractive fast path (answer from the top chunk without calling the LLM)
+EXTRACTIVE_ANSWERS = os.getenv("EXTRACTIVE_ANSWERS", "false").lower() == "true"
+EXTRACTIVE_MAX_DISTANCE = float(os.getenv("EXTRACTIVE_MAX_DISTANCE", "0.6"))  # top chunk distance
+EXTRACTIVE_MIN_MARGIN = float(os.getenv("EXTRACTIVE_MIN_MARGIN", "0.15"))  # gap to 2nd chunk
+EXTRACTIVE_MAX_SENTENCES = 3
+
+# Precomputed answers for frequent questions (built after each index build)
+PRECOMPUTED_ANSWERS_FILE = PROCESSED_DATA_DIR / "precomputed_answers.json"
+SEED_QUESTIONS_FILE = DATA_DIR / "seed_questions.txt"  # one question per line
+QUERY_LOG_FILE = DATA_DIR / "query_log.txt"
+LOG_QUERIES = os.getenv("LOG_QUERIES", "false").lower() == "true"
+PRECOMPUTE_TOP_QUERIES = 300
+PRECOMPUTE_WORKERS = int(os.getenv("PRECOMPUTE_WORKERS", "4"))
+
+# Conversation sessions (multi-turn chat)
+SESSION_HISTORY_TURNS = 4  # turns kept per session
+SESSION_IDLE_SECONDS = 30 * 60  # evict sessions idle longer than this
+SESSION_MAX_COUNT = 1000  # evict least recently used sessions beyond this
+CONTEXT_REUSE_SIMILARITY = 0.9  # cosine to previous query to reuse its chunks
+
 # LLM settings (Ollama - local)
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "phi3")
 LLM_TEMPERATURE = 0.1
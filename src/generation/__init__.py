@@ -1,9 +1,15 @@
 """Generation module for LLM and RAG chain."""
 
+from src.generation.answer_cache import lookup_answer, precompute_answers
+from src.generation.conversation import ask_in_session, end_session
 from src.generation.rag_chain import ask, ask_with_sources, create_rag_chain
 
 __all__ = [
     "ask",
+    "ask_in_session",
+    "end_session",
     "ask_with_sources",
     "create_rag_chain",
+    "lookup_answer",
+    "precompute_answers",
 ]
@@ -0,0 +1,262 @@
+"""Precomputed answers for the most frequent HR questions.
+
+After an index build, the precompute job answers the seed questions plus the
+most frequently logged queries with the normal pipeline and stores them keyed
+by normalized question and index version. Serving checks this table before
+retrieval. Entries are only regenerated when their retrieved chunks change.
+
+Usage:
+    python -m src.generation.answer_cache
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from langchain_core.documents import Document
+
+from src.config import (
+    EXTRACTIVE_ANSWERS,
+    PRECOMPUTE_TOP_QUERIES,
+    PRECOMPUTE_WORKERS,
+    PRECOMPUTED_ANSWERS_FILE,
+    QUERY_LOG_FILE,
+    SEED_QUESTIONS_FILE,
+)
+from src.retrieval.index_versions import get_current_collection
+
+# Loaded table, keyed by file stat so it is only re-read when the job rewrites it
+_table_cache: dict = {"stat": None, "table": None}
+_query_log_lock = threading.Lock()
+
+
+def normalize_question(question: str) -> str:
+    """Normalize a question for lookup (case, punctuation, whitespace)."""
+    words = re.findall(r"[a-z0-9]+", question.lower())
+    return " ".join(words)
+
+
+def _load_table(answers_file: Path = PRECOMPUTED_ANSWERS_FILE) -> Optional[dict]:
+    """Load the precomputed answer table, re-reading only when it changes."""
+    try:
+        stat = answers_file.stat()
+    except FileNotFoundError:
+        return None
+
+    stat_key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    if _table_cache["stat"] != stat_key:
+        with open(answers_file) as f:
+            _table_cache["table"] = json.load(f)
+        _table_cache["stat"] = stat_key
+
+    return _table_cache["table"]
+
+
+def lookup_answer(question: str) -> Optional[dict]:
+    """
+    Find a precomputed answer for a question on the current index version.
+
+    Returns:
+        Dict with 'answer', 'sources' and 'answered_by' keys, or None
+    """
+    table = _load_table()
+    if table is None or table.get("index_version") != get_current_collection():
+        return None
+
+    entry = table["answers"].get(normalize_question(question))
+    if entry is None:
+        return None
+
+    return {
+        "answer": entry["answer"],
+        "sources": entry["sources"],
+        "answered_by": "precomputed",
+    }
+
+
+def log_query(question: str, log_file: Path = QUERY_LOG_FILE) -> None:
+    """Append a question to the query log used to pick questions to precompute."""
+    line = question.replace("\n", " ").strip()
+    if not line:
+        return
+
+    with _query_log_lock:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def collect_questions(
+    seed_file: Path = SEED_QUESTIONS_FILE,
+    log_file: Path = QUERY_LOG_FILE,
+    top_n: int = PRECOMPUTE_TOP_QUERIES,
+) -> list[str]:
+    """
+    Gather questions to precompute: all seed questions plus the top logged ones.
+
+    Returns:
+        Questions with distinct normalized forms, seeds first
+    """
+    questions: dict[str, str] = {}
+
+    if seed_file.exists():
+        for line in seed_file.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                questions.setdefault(normalize_question(line), line)
+
+    if log_file.exists():
+        counts: Counter = Counter()
+        originals: dict[str, str] = {}
+        for line in log_file.read_text(encoding="utf-8").splitlines():
+            key = normalize_question(line)
+            if key:
+                counts[key] += 1
+                originals.setdefault(key, line.strip())
+
+        for key, _ in counts.most_common(top_n):
+            questions.setdefault(key, originals[key])
+
+    return list(questions.values())
+
+
+def _fingerprint(docs: list[Document]) -> str:
+    """Hash the chunks retrieved for a question."""
+    digest = hashlib.sha1()
+    for doc in docs:
+        digest.update(doc.page_content.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _generator_signature() -> str:
+    """Hash the settings that shape an answer, so a change invalidates every entry."""
+    from src.config import (
+        EXTRACTIVE_MAX_DISTANCE,
+        EXTRACTIVE_MAX_SENTENCES,
+        EXTRACTIVE_MIN_MARGIN,
+        LLM_TEMPERATURE,
+        OLLAMA_MODEL,
+    )
+    from src.generation.prompts import RAG_PROMPT
+
+    settings = {
+        "model": OLLAMA_MODEL,
+        "temperature": LLM_TEMPERATURE,
+        "prompt": RAG_PROMPT.template,
+        "extractive": EXTRACTIVE_ANSWERS,
+        "extractive_thresholds": [
+            EXTRACTIVE_MAX_DISTANCE,
+            EXTRACTIVE_MIN_MARGIN,
+            EXTRACTIVE_MAX_SENTENCES,
+        ],
+    }
+    return hashlib.sha1(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def precompute_answers(
+    questions: Optional[list[str]] = None,
+    answers_file: Path = PRECOMPUTED_ANSWERS_FILE,
+    max_workers: int = PRECOMPUTE_WORKERS,
+) -> dict:
+    """
+    Answer frequent questions ahead of time for the current index version.
+
+    Each question is retrieved once. Entries from the previous table are
+    reused when those chunks are unchanged and the table was produced with
+    the same model, prompt and extractive settings; everything else is
+    answered from them in parallel.
+
+    Args:
+        questions: Questions to precompute; defaults to collect_questions()
+        answers_file: Where to write the lookup table
+        max_workers: Number of questions answered concurrently
+
+    Returns:
+        Dict with counts of reused and regenerated entries
+    """
+    from src.generation.extractive import extractive_answer
+    from src.generation.rag_chain import format_sources, generate_answer
+    from src.retrieval.vector_store import similarity_search_with_scores
+
+    if questions is None:
+        questions = collect_questions()
+
+    index_version = get_current_collection()
+    generator = _generator_signature()
+
+    previous = _load_table(answers_file) or {"answers": {}}
+    if previous.get("generator") != generator:
+        previous = {"answers": {}}
+
+    print(f"Precomputing {len(questions)} answers for {index_version}...")
+
+    def answer(question: str) -> tuple[str, dict, bool]:
+        key = normalize_question(question)
+        # Retrieve once through the cached current store; the same chunks
+        # decide whether to reuse the old entry and feed the answer
+        scored_docs = similarity_search_with_scores(question)
+        docs = [doc for doc, _ in scored_docs]
+        fingerprint = _fingerprint(docs)
+
+        old_entry = previous["answers"].get(key)
+        if old_entry is not None and old_entry["fingerprint"] == fingerprint:
+            return key, old_entry, True
+
+        extracted = extractive_answer(question, scored_docs) if EXTRACTIVE_ANSWERS else None
+        if extracted is not None:
+            result = {"answer": extracted, "sources": format_sources(docs[:1])}
+        else:
+            result = generate_answer(question, docs)
+
+        entry = {
+            "question": question,
+            "answer": result["answer"],
+            "sources": result["sources"],
+            "fingerprint": fingerprint,
+        }
+        return key, entry, False
+
+    answers = {}
+    reused = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for key, entry, was_reused in executor.map(answer, questions):
+            answers[key] = entry
+            reused += was_reused
+
+    table = {"index_version": index_version, "generator": generator, "answers": answers}
+
+    # Write next to the live table, then swap it in
+    answers_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=answers_file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(table, f)
+        os.replace(tmp_path, answers_file)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+    stats = {
+        "index_version": index_version,
+        "questions": len(answers),
+        "reused": reused,
+        "regenerated": len(answers) - reused,
+    }
+    print(f"Saved {len(answers)} precomputed answers to {answers_file}")
+    return stats
+
+
+if __name__ == "__main__":
+    stats = precompute_answers()
+
+    print("\n--- Precompute Stats ---")
+    for key, value in stats.items():
+        print(f"{key}: {value}")
@@ -0,0 +1,211 @@
+"""Conversation-aware question answering with per-session context reuse.
+
+Follow-up questions ("and for part-time employees?") are folded into the
+previous question before retrieval. If the resulting query embedding is
+close to the previous turn's, that turn's retrieved chunks are reused
+instead of searching again. Sessions keep a short history window and are
+evicted when idle.
+"""
+
+import re
+import threading
+import time
+from array import array
+from collections import OrderedDict, deque
+from typing import Optional
+
+from langchain_core.documents import Document
+
+from src.config import (
+    CONTEXT_REUSE_SIMILARITY,
+    EXTRACTIVE_ANSWERS,
+    LOG_QUERIES,
+    SESSION_HISTORY_TURNS,
+    SESSION_IDLE_SECONDS,
+    SESSION_MAX_COUNT,
+)
+from src.generation.answer_cache import log_query, lookup_answer
+from src.generation.extractive import STOPWORDS, extractive_answer
+from src.generation.rag_chain import format_sources, generate_answer
+from src.retrieval.embeddings import get_embedding_model
+from src.retrieval.index_versions import get_current_collection
+from src.retrieval.vector_store import similarity_search_by_vector_with_scores
+
+FOLLOW_UP_PREFIXES = (
+    "and ", "also ", "but ", "what about ", "how about ", "what if ", "same for ",
+    "does that ", "does this ", "does it ", "is that ", "can they ",
+)
+FOLLOW_UP_WORDS = {
+    "it", "that", "this", "they", "them", "those", "these", "there", "same",
+    "else", "then", "so", "one", "ones",
+}
+
+
+class ConversationSession:
+    """History window and last retrieval for one chat session."""
+
+    __slots__ = ("questions", "index_version", "query_embedding", "scored_docs", "last_used")
+
+    def __init__(self, max_turns: int = SESSION_HISTORY_TURNS):
+        self.questions: deque = deque(maxlen=max_turns)
+        self.index_version: Optional[str] = None
+        self.query_embedding: Optional[array] = None
+        self.scored_docs: list[tuple[Document, float]] = []
+        self.last_used = time.monotonic()
+
+
+class SessionStore:
+    """Bounded in-memory sessions, evicted when idle or least recently used."""
+
+    def __init__(
+        self,
+        idle_seconds: float = SESSION_IDLE_SECONDS,
+        max_sessions: int = SESSION_MAX_COUNT,
+    ):
+        self._sessions: OrderedDict[str, ConversationSession] = OrderedDict()
+        self._idle_seconds = idle_seconds
+        self._max_sessions = max_sessions
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> ConversationSession:
+        """Get a session, creating it if needed, and evict stale ones."""
+        now = time.monotonic()
+
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+
+            # Oldest sessions are at the front, so stop at the first fresh one
+            while self._sessions:
+                oldest_id, oldest = next(iter(self._sessions.items()))
+                if now - oldest.last_used < self._idle_seconds:
+                    break
+                del self._sessions[oldest_id]
+
+            if session is None:
+                session = ConversationSession()
+            session.last_used = now
+            self._sessions[session_id] = session
+
+            while len(self._sessions) > self._max_sessions:
+                self._sessions.popitem(last=False)
+
+            return session
+
+    def end(self, session_id: str) -> None:
+        """Forget a session."""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+_sessions = SessionStore()
+
+
+def is_follow_up(question: str) -> bool:
+    """
+    Check if a question leans on the previous turn for its meaning.
+
+    True when it opens with a connective ("and ...", "what about ...") or
+    has no content words of its own ("why is that?"). Standalone questions
+    that merely mention "there" or "this" are not follow-ups.
+    """
+    text = question.lower().strip()
+    if text.startswith(FOLLOW_UP_PREFIXES):
+        return True
+
+    words = re.findall(r"[a-z0-9]+", text)
+    return not any(w not in STOPWORDS and w not in FOLLOW_UP_WORDS for w in words)
+
+
+def condense_question(session: ConversationSession, question: str) -> str:
+    """Combine a follow-up with the question it builds on into a standalone query."""
+    if not is_follow_up(question):
+        return question
+
+    # Chained follow-ups all attach to the last standalone question
+    for previous in reversed(session.questions):
+        if not is_follow_up(previous):
+            return f"{previous} {question}"
+    return question
+
+
+def _cosine(a: array, b: array) -> float:
+    """Cosine similarity of two normalized embeddings."""
+    return sum(x * y for x, y in zip(a, b))
+
+
+def ask_in_session(
+    session_id: str,
+    question: str,
+    extractive: bool = EXTRACTIVE_ANSWERS,
+    store: Optional[SessionStore] = None,
+) -> dict:
+    """
+    Answer a question in the context of an ongoing chat session.
+
+    Args:
+        session_id: Stable identifier for the chat (e.g. one per browser session)
+        question: The HR-related question to answer
+        extractive: If True, answer straight from the top chunk when
+            retrieval is confident, skipping the LLM
+        store: Session store to use; defaults to the process-wide store
+
+    Returns:
+        Dict with 'answer', 'sources', 'answered_by' and 'reused_context' keys
+    """
+    session = (store or _sessions).get(session_id)
+    query = condense_question(session, question)
+
+    # Log the standalone form so follow-up fragments never become precompute candidates
+    if LOG_QUERIES:
+        log_query(query)
+
+    result = lookup_answer(query)
+    if result is not None:
+        session.questions.append(question)
+        return {**result, "reused_context": False}
+
+    # Cached chunks from an index version that has since been swapped out are stale
+    index_version = get_current_collection()
+    if session.index_version != index_version:
+        session.index_version = index_version
+        session.query_embedding = None
+        session.scored_docs = []
+
+    embedding = array("f", get_embedding_model().embed_query(query))
+
+    reused_context = (
+        session.query_embedding is not None
+        and bool(session.scored_docs)
+        and _cosine(embedding, session.query_embedding) >= CONTEXT_REUSE_SIMILARITY
+    )
+    if reused_context:
+        scored_docs = session.scored_docs
+    else:
+        scored_docs = similarity_search_by_vector_with_scores(list(embedding))
+        session.query_embedding = embedding
+        session.scored_docs = scored_docs
+
+    # Reused scores belong to the earlier query, so only trust fresh ones
+    result = None
+    if extractive and not reused_context:
+        answer = extractive_answer(query, scored_docs)
+        if answer is not None:
+            result = {
+                "answer": answer,
+                "sources": format_sources([scored_docs[0][0]]),
+                "answered_by": "extractive",
+            }
+
+    if result is None:
+        result = generate_answer(query, [doc for doc, _ in scored_docs])
+
+    session.questions.append(question)
+    return {**result, "reused_context": reused_context}
+
+
+def end_session(session_id: str) -> None:
+    """Forget a chat session's history and cached retrieval."""
+    _sessions.end(session_id)
@@ -0,0 +1,189 @@
+"""Extractive answers for high-confidence retrievals (no LLM call).
+
+When the top chunk is both close to the question and clearly ahead of the
+runner-up, the most relevant sentences from that chunk are returned as the
+answer. Scores are Chroma distances (lower is closer).
+
+Tune the thresholds against a labeled question set:
+    python -m src.generation.extractive [path/to/questions.json]
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Optional
+
+from langchain_core.documents import Document
+
+from src.config import (
+    BENCHMARK_FILE,
+    EXTRACTIVE_MAX_DISTANCE,
+    EXTRACTIVE_MAX_SENTENCES,
+    EXTRACTIVE_MIN_MARGIN,
+)
+from src.ingestion.deduplication import chunk_sources, source_name
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "does",
+    "for", "from", "get", "how", "i", "if", "in", "is", "it", "many", "much",
+    "my", "of", "on", "or", "our", "the", "to", "we", "what", "when", "where",
+    "which", "who", "why", "will", "with", "you", "your",
+}
+
+
+def _terms(text: str) -> set[str]:
+    """Lowercase content words in a piece of text."""
+    return {w for w in re.findall(r"[a-z0-9]+", text.lower()) if w not in STOPWORDS}
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split a chunk into sentences and list items, dropping header lines."""
+    sentences = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        sentences.extend(s.strip() for s in re.split(r"(?<=[.!?])\s+", line) if s.strip())
+    return sentences
+
+
+def is_confident(
+    scored_docs: list[tuple[Document, float]],
+    max_distance: float = EXTRACTIVE_MAX_DISTANCE,
+    min_margin: float = EXTRACTIVE_MIN_MARGIN,
+) -> bool:
+    """Check if the top result is close enough and ahead of the runner-up."""
+    if not scored_docs:
+        return False
+
+    top_distance = scored_docs[0][1]
+    if top_distance > max_distance:
+        return False
+
+    if len(scored_docs) > 1 and scored_docs[1][1] - top_distance < min_margin:
+        return False
+
+    return True
+
+
+def extract_sentences(
+    question: str,
+    text: str,
+    max_sentences: int = EXTRACTIVE_MAX_SENTENCES,
+) -> str:
+    """
+    Pick the sentences in a chunk that best overlap the question.
+
+    Args:
+        question: The employee's question
+        text: Chunk content to extract from
+        max_sentences: Maximum number of sentences to return
+
+    Returns:
+        The selected sentences in their original order (empty if none match)
+    """
+    question_terms = _terms(question)
+    sentences = split_sentences(text)
+
+    scored = []
+    for position, sentence in enumerate(sentences):
+        overlap = len(question_terms & _terms(sentence))
+        if overlap:
+            scored.append((overlap, position))
+
+    best = sorted(scored, key=lambda item: (-item[0], item[1]))[:max_sentences]
+    return " ".join(sentences[position] for _, position in sorted(best, key=lambda item: item[1]))
+
+
+def extractive_answer(
+    question: str,
+    scored_docs: list[tuple[Document, float]],
+    max_distance: float = EXTRACTIVE_MAX_DISTANCE,
+    min_margin: float = EXTRACTIVE_MIN_MARGIN,
+) -> Optional[str]:
+    """
+    Answer from the top chunk if retrieval is confident enough.
+
+    Args:
+        question: The employee's question
+        scored_docs: (document, distance) tuples, closest first
+        max_distance: Largest distance allowed for the top chunk
+        min_margin: Smallest distance gap required to the second chunk
+
+    Returns:
+        The extracted answer with its citation, or None to fall back to the LLM
+    """
+    if not is_confident(scored_docs, max_distance, min_margin):
+        return None
+
+    top_doc = scored_docs[0][0]
+    answer = extract_sentences(question, top_doc.page_content)
+    if not answer:
+        return None
+
+    source = top_doc.metadata.get("filename", "Unknown")
+    return f"{answer}\n\n(Source: {source})"
+
+
+def tune_thresholds(
+    benchmark_file: Path = BENCHMARK_FILE,
+    distances: Optional[list[float]] = None,
+    margins: Optional[list[float]] = None,
+) -> list[dict]:
+    """
+    Measure extractive coverage and precision over a grid of thresholds.
+
+    The benchmark file is a JSON list of {"question", "expected_source"}
+    entries, where expected_source is a document's file name (the .md/.txt
+    extension is optional).
+
+    Returns:
+        One dict per (max_distance, min_margin) pair with coverage and precision
+    """
+    from src.retrieval.vector_store import similarity_search_with_scores
+
+    if distances is None:
+        distances = [0.3, 0.4, 0.5, 0.6, 0.7, 0.8]
+    if margins is None:
+        margins = [0.0, 0.05, 0.1, 0.15, 0.2, 0.3]
+
+    with open(benchmark_file) as f:
+        benchmark = json.load(f)
+
+    # Retrieve once per question, then replay every threshold pair
+    runs = []
+    for item in benchmark:
+        scored_docs = similarity_search_with_scores(item["question"])
+        expected = source_name(item["expected_source"])
+        correct = bool(scored_docs) and expected in chunk_sources(scored_docs[0][0].metadata)
+        runs.append((item["question"], scored_docs, correct))
+
+    results = []
+    for max_distance in distances:
+        for min_margin in margins:
+            answered = [
+                correct
+                for question, scored_docs, correct in runs
+                if extractive_answer(question, scored_docs, max_distance, min_margin)
+            ]
+            results.append({
+                "max_distance": max_distance,
+                "min_margin": min_margin,
+                "coverage": len(answered) / len(runs) if runs else 0.0,
+                "precision": sum(answered) / len(answered) if answered else 0.0,
+            })
+
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else BENCHMARK_FILE
+
+    print(f"{'distance':>8}  {'margin':>6}  {'coverage':>8}  {'precision':>9}")
+    for row in tune_thresholds(path):
+        print(
+            f"{row['max_distance']:>8.2f}  {row['min_margin']:>6.2f}  "
+            f"{row['coverage']:>8.1%}  {row['precision']:>9.1%}"
+        )
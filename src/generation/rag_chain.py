@@ -4,9 +4,12 @@ from langchain_core.documents import Document
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnablePassthrough
 
+from src.config import EXTRACTIVE_ANSWERS, LOG_QUERIES
+from src.generation.answer_cache import log_query, lookup_answer
+from src.generation.extractive import extractive_answer
 from src.generation.llm import get_llm
 from src.generation.prompts import RAG_PROMPT
-from src.retrieval.vector_store import get_retriever
+from src.retrieval.vector_store import get_retriever, similarity_search_with_scores
 
 
 def format_docs(docs: list[Document]) -> str:
@@ -59,38 +62,86 @@ def ask(question: str) -> str:
     return chain.invoke(question)
 
 
-def ask_with_sources(question: str) -> dict:
+def format_sources(docs: list[Document]) -> list[dict]:
+    """Extract source info for display alongside an answer."""
+    return [
+        {
+            "filename": doc.metadata.get("filename", "Unknown"),
+            "category": doc.metadata.get("category", "general"),
+            "excerpt": doc.page_content[:200] + "...",
+            # Other documents a deduplicated chunk also appears in
+            "also_in": [
+                name
+                for name in doc.metadata.get("duplicate_sources", "").split(", ")
+                if name and name != doc.metadata.get("filename", "Unknown")
+            ],
+        }
+        for doc in docs
+    ]
+
+
+def ask_with_sources(
+    question: str,
+    extractive: bool = EXTRACTIVE_ANSWERS,
+    use_precomputed: bool = True,
+) -> dict:
     """
     Ask a question and get an answer with source documents.
 
     Args:
         question: The HR-related question to answer
+        extractive: If True, answer straight from the top chunk when
+            retrieval is confident, skipping the LLM
+        use_precomputed: If True, return a precomputed answer when one exists
+            for the current index version
 
     Returns:
-        Dict with 'answer' and 'sources' keys
+        Dict with 'answer', 'sources' and 'answered_by'
+        ("precomputed", "extractive" or "llm") keys
     """
-    retriever = get_retriever()
-    llm = get_llm()
+    if use_precomputed:
+        if LOG_QUERIES:
+            log_query(question)
+
+        precomputed = lookup_answer(question)
+        if precomputed is not None:
+            return precomputed
+
+    if extractive:
+        scored_docs = similarity_search_with_scores(question)
+        answer = extractive_answer(question, scored_docs)
+        if answer is not None:
+            return {
+                "answer": answer,
+                "sources": format_sources([scored_docs[0][0]]),
+                "answered_by": "extractive",
+            }
+        docs = [doc for doc, _ in scored_docs]
+    else:
+        docs = get_retriever().invoke(question)
+
+    return generate_answer(question, docs)
+
+
+def generate_answer(question: str, docs: list[Document]) -> dict:
+    """
+    Generate an answer with the LLM from already retrieved documents.
 
-    # Get documents first
-    docs = retriever.invoke(question)
+    Args:
+        question: The HR-related question to answer
+        docs: Retrieved documents to use as context
+
+    Returns:
+        Dict with 'answer', 'sources' and 'answered_by' keys
+    """
     context = format_docs(docs)
 
     # Generate answer
-    chain = RAG_PROMPT | llm | StrOutputParser()
+    chain = RAG_PROMPT | get_llm() | StrOutputParser()
     answer = chain.invoke({"context": context, "question": question})
 
-    # Extract source info
-    sources = [
-        {
-            "filename": doc.metadata.get("filename", "Unknown"),
-            "category": doc.metadata.get("category", "general"),
-            "excerpt": doc.page_content[:200] + "...",
-        }
-        for doc in docs
-    ]
-
     return {
         "answer": answer,
-        "sources": sources,
+        "sources": format_sources(docs),
+        "answered_by": "llm",
     }
@@ -1,5 +1,6 @@
 """Document ingestion module for loading and processing HR documents."""
 
+from src.ingestion.deduplication import deduplicate_chunks
 from src.ingestion.document_loader import load_all_documents
 from src.ingestion.pipeline import load_chunks, run_ingestion_pipeline
 from src.ingestion.text_processor import chunk_markdown_by_headers
@@ -9,4 +10,5 @@ __all__ = [
     "run_ingestion_pipeline",
     "load_chunks",
     "chunk_markdown_by_headers",
+    "deduplicate_chunks",
 ]
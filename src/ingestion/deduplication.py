@@ -0,0 +1,173 @@
+"""Near-duplicate chunk removal using MinHash signatures and LSH banding.
+
+Each chunk is reduced to a MinHash signature over its word shingles. LSH
+buckets signatures by band so only chunks sharing a band are compared,
+which avoids comparing every pair of chunks.
+"""
+
+import re
+import zlib
+
+import numpy as np
+from langchain_core.documents import Document
+
+from src.config import (
+    DEDUP_BANDS,
+    DEDUP_NUM_PERM,
+    DEDUP_SHINGLE_SIZE,
+    DEDUP_THRESHOLD,
+)
+
+# Mersenne prime for the (a * x + b) % p permutation family
+_PRIME = (1 << 31) - 1
+
+
+def _shingle_hashes(text: str, shingle_size: int) -> np.ndarray:
+    """Hash the overlapping word shingles of a text."""
+    words = re.findall(r"\w+", text.lower())
+    if len(words) <= shingle_size:
+        shingles = [" ".join(words)]
+    else:
+        shingles = [
+            " ".join(words[i : i + shingle_size])
+            for i in range(len(words) - shingle_size + 1)
+        ]
+
+    hashes = {zlib.crc32(s.encode("utf-8")) % _PRIME for s in shingles}
+    return np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+
+
+def minhash_signatures(
+    texts: list[str],
+    num_perm: int = DEDUP_NUM_PERM,
+    shingle_size: int = DEDUP_SHINGLE_SIZE,
+) -> np.ndarray:
+    """
+    Compute a MinHash signature for each text.
+
+    Returns:
+        Array of shape (len(texts), num_perm)
+    """
+    rng = np.random.RandomState(1)
+    a = rng.randint(1, _PRIME, size=num_perm).astype(np.uint64)
+    b = rng.randint(0, _PRIME, size=num_perm).astype(np.uint64)
+
+    signatures = np.empty((len(texts), num_perm), dtype=np.uint64)
+    for row, text in enumerate(texts):
+        hashes = _shingle_hashes(text, shingle_size)
+        signatures[row] = ((np.outer(hashes, a) + b) % _PRIME).min(axis=0)
+
+    return signatures
+
+
+def find_duplicate_clusters(
+    signatures: np.ndarray,
+    threshold: float = DEDUP_THRESHOLD,
+    bands: int = DEDUP_BANDS,
+) -> list[list[int]]:
+    """
+    Group near-identical signatures using LSH banding.
+
+    Args:
+        signatures: MinHash signatures, one row per chunk
+        threshold: Minimum estimated Jaccard similarity to merge two chunks
+        bands: Number of LSH bands
+
+    Returns:
+        Clusters of row indices (singletons included), in first-seen order
+    """
+    count, num_perm = signatures.shape
+    if num_perm % bands:
+        raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+    rows = num_perm // bands
+
+    parent = list(range(count))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for band in range(bands):
+        buckets: dict[bytes, list[int]] = {}
+        band_slice = signatures[:, band * rows : (band + 1) * rows]
+        for i in range(count):
+            buckets.setdefault(band_slice[i].tobytes(), []).append(i)
+
+        # Compare against the bucket's first member only, so a bucket full of
+        # repeated boilerplate costs one comparison per member
+        for first, *others in buckets.values():
+            for other in others:
+                root_first, root_other = find(first), find(other)
+                if root_first == root_other:
+                    continue
+                if np.mean(signatures[first] == signatures[other]) >= threshold:
+                    parent[root_other] = root_first
+
+    clusters: dict[int, list[int]] = {}
+    for i in range(count):
+        clusters.setdefault(find(i), []).append(i)
+
+    return list(clusters.values())
+
+
+def chunk_sources(metadata: dict) -> set[str]:
+    """Filenames a chunk stands for: its own plus any merged duplicates."""
+    sources = {metadata.get("filename", "Unknown")}
+    sources.update(s for s in metadata.get("duplicate_sources", "").split(", ") if s)
+    return sources
+
+
+def source_name(filename: str) -> str:
+    """Match enrich_metadata's "filename": the file name without a .md/.txt extension."""
+    if filename.lower().endswith((".md", ".txt")):
+        return filename.rsplit(".", 1)[0]
+    return filename
+
+
+def deduplicate_chunks(
+    chunks: list[Document],
+    threshold: float = DEDUP_THRESHOLD,
+) -> list[Document]:
+    """
+    Collapse near-duplicate chunks into one canonical chunk each.
+
+    The longest chunk in each cluster is kept. Its metadata records how many
+    copies were dropped and which source files they came from.
+
+    Args:
+        chunks: Document chunks from the chunking step
+        threshold: Minimum estimated Jaccard similarity to treat as duplicates
+
+    Returns:
+        Deduplicated chunks in their original order
+    """
+    if not chunks:
+        return []
+
+    signatures = minhash_signatures([c.page_content for c in chunks])
+    clusters = find_duplicate_clusters(signatures, threshold=threshold)
+
+    keep = []
+    for members in clusters:
+        canonical_index = max(members, key=lambda i: (len(chunks[i].page_content), -i))
+        canonical = chunks[canonical_index]
+
+        if len(members) > 1:
+            filenames = {chunks[i].metadata.get("filename", "Unknown") for i in members}
+            metadata = canonical.metadata.copy()
+            metadata["duplicate_count"] = len(members) - 1
+            metadata["duplicate_sources"] = ", ".join(sorted(filenames))
+            canonical = Document(page_content=canonical.page_content, metadata=metadata)
+
+        keep.append((canonical_index, canonical))
+
+    deduplicated = [chunk for _, chunk in sorted(keep, key=lambda item: item[0])]
+
+    removed = len(chunks) - len(deduplicated)
+    print(
+        f"Removed {removed} near-duplicate chunks "
+        f"({len(chunks)} -> {len(deduplicated)}, -{removed / len(chunks):.1%})"
+    )
+    return deduplicated
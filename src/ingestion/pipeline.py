@@ -6,6 +6,7 @@ from pathlib import Path
 from langchain_core.documents import Document
 
 from src.config import PROCESSED_DATA_DIR, RAW_DATA_DIR
+from src.ingestion.deduplication import deduplicate_chunks
 from src.ingestion.document_loader import load_all_documents
 from src.ingestion.text_processor import (
     chunk_markdown_by_headers,
@@ -17,6 +18,7 @@ def run_ingestion_pipeline(
     input_dir: Path = RAW_DATA_DIR,
     output_dir: Path = PROCESSED_DATA_DIR,
     save_to_disk: bool = True,
+    deduplicate: bool = True,
 ) -> list[Document]:
     """
     Run the full document ingestion pipeline.
@@ -25,7 +27,8 @@ def run_ingestion_pipeline(
     1. Load all documents from input directory
     2. Enrich metadata (categorization, etc.)
     3. Chunk documents for embedding
-    4. Optionally save processed chunks to disk
+    4. Optionally collapse near-duplicate chunks
+    5. Optionally save processed chunks to disk
 
     Returns:
         List of processed document chunks ready for embedding
@@ -35,7 +38,7 @@ def run_ingestion_pipeline(
     print("=" * 50)
 
     # Step 1: Load documents
-    print("\n[1/3] Loading documents...")
+    print("\n[1/4] Loading documents...")
     documents = load_all_documents(input_dir)
 
     if not documents:
@@ -43,13 +46,18 @@ def run_ingestion_pipeline(
         return []
 
     # Step 2: Enrich metadata
-    print("\n[2/3] Enriching metadata...")
+    print("\n[2/4] Enriching metadata...")
     documents = enrich_metadata(documents)
 
     # Step 3: Chunk documents
-    print("\n[3/3] Chunking documents...")
+    print("\n[3/4] Chunking documents...")
     chunks = chunk_markdown_by_headers(documents)
 
+    # Step 4: Remove near-duplicate chunks
+    if deduplicate:
+        print("\n[4/4] Removing near-duplicate chunks...")
+        chunks = deduplicate_chunks(chunks)
+
     # Save to disk if requested
     if save_to_disk:
         save_chunks(chunks, output_dir)
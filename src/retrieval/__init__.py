@@ -1,12 +1,19 @@
 """Retrieval module for vector store and semantic search."""
 
 from src.retrieval.embeddings import get_embedding_model
+from src.retrieval.index_versions import (
+    get_current_collection,
+    list_versions,
+    prune_versions,
+    rollback,
+)
 from src.retrieval.indexer import build_index, get_index_stats
 from src.retrieval.vector_store import (
     add_documents,
     get_retriever,
     get_vector_store,
     similarity_search,
+    similarity_search_by_vector_with_scores,
     similarity_search_with_scores,
 )
 
@@ -14,9 +21,14 @@ __all__ = [
     "get_embedding_model",
     "build_index",
     "get_index_stats",
+    "get_current_collection",
+    "list_versions",
+    "prune_versions",
+    "rollback",
     "add_documents",
     "get_retriever",
     "get_vector_store",
     "similarity_search",
+    "similarity_search_by_vector_with_scores",
     "similarity_search_with_scores",
 ]
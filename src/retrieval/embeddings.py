@@ -1,12 +1,21 @@
 """Embedding model configuration using local sentence-transformers."""
 
-from langchain_huggingface import HuggingFaceEmbeddings
+from functools import lru_cache
 
-from src.config import LOCAL_EMBEDDING_MODEL
+from src.config import EMBEDDING_BACKEND, LOCAL_EMBEDDING_MODEL
 
 
+@lru_cache(maxsize=1)
 def get_embedding_model():
-    """Get the local embedding model (sentence-transformers)."""
+    """Get the local embedding model for the configured backend (loaded once per process)."""
+    if EMBEDDING_BACKEND == "onnx":
+        from src.retrieval.onnx_embeddings import OnnxEmbeddings
+
+        return OnnxEmbeddings()
+
+    # Imported here so the ONNX backend never loads torch
+    from langchain_huggingface import HuggingFaceEmbeddings
+
     return HuggingFaceEmbeddings(
         model_name=LOCAL_EMBEDDING_MODEL,
         model_kwargs={"device": "cpu"},
@@ -0,0 +1,159 @@
+"""Versioned index collections with an atomically swapped "current" pointer.
+
+Each build writes a new collection named ``<COLLECTION_NAME>_v<timestamp>``.
+Once validated, the pointer file is replaced in a single ``os.replace`` so
+running workers pick up the new version on their next lookup.
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import chromadb
+
+from src.config import CHROMA_DB_DIR, COLLECTION_NAME, CURRENT_INDEX_FILE
+
+VERSION_PREFIX = f"{COLLECTION_NAME}_v"
+
+# Last pointer read by this process, keyed by file stat so it is only re-read on change
+_pointer_cache: dict = {"stat": None, "collection": COLLECTION_NAME}
+
+
+def new_version_name() -> str:
+    """Create a collection name for a new index build."""
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S%f")
+    return f"{VERSION_PREFIX}{timestamp}"
+
+
+def get_current_collection(pointer_file: Path = CURRENT_INDEX_FILE) -> str:
+    """
+    Get the collection name the current index points to.
+
+    Falls back to the unversioned COLLECTION_NAME if no build has
+    been published yet.
+    """
+    try:
+        stat = pointer_file.stat()
+    except FileNotFoundError:
+        return COLLECTION_NAME
+
+    stat_key = (str(pointer_file), stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    if _pointer_cache["stat"] != stat_key:
+        with open(pointer_file) as f:
+            _pointer_cache["collection"] = json.load(f)["collection"]
+        _pointer_cache["stat"] = stat_key
+
+    return _pointer_cache["collection"]
+
+
+def set_current_collection(
+    collection_name: str,
+    pointer_file: Path = CURRENT_INDEX_FILE,
+) -> None:
+    """Atomically point the current index at a collection."""
+    pointer_file.parent.mkdir(parents=True, exist_ok=True)
+
+    pointer = {
+        "collection": collection_name,
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+    # Write to a temp file in the same directory, then rename over the pointer
+    fd, tmp_path = tempfile.mkstemp(dir=pointer_file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(pointer, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, pointer_file)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+    print(f"Current index is now: {collection_name}")
+
+
+def list_versions(persist_directory: Optional[Path] = None) -> list[str]:
+    """
+    List index versions, oldest first.
+
+    The unversioned COLLECTION_NAME collection, which served traffic before
+    the first versioned build, counts as the oldest version.
+    """
+    if persist_directory is None:
+        persist_directory = CHROMA_DB_DIR
+
+    client = chromadb.PersistentClient(path=str(persist_directory))
+    legacy = []
+    names = []
+    for collection in client.list_collections():
+        # Older chromadb returns Collection objects, newer returns names
+        name = getattr(collection, "name", collection)
+        if name == COLLECTION_NAME:
+            legacy.append(name)
+        elif name.startswith(VERSION_PREFIX):
+            names.append(name)
+
+    return legacy + sorted(names)
+
+
+def rollback(
+    version: Optional[str] = None,
+    persist_directory: Optional[Path] = None,
+    pointer_file: Path = CURRENT_INDEX_FILE,
+) -> str:
+    """
+    Point the current index back at an earlier version.
+
+    Args:
+        version: Collection to switch to; defaults to the one before current
+        persist_directory: Directory holding the ChromaDB collections
+        pointer_file: The current-version pointer to update
+
+    Returns:
+        The collection name now marked current
+    """
+    versions = list_versions(persist_directory)
+
+    if version is None:
+        current = get_current_collection(pointer_file)
+        if current not in versions:
+            raise ValueError(f"Current version {current} not found")
+        older = versions[: versions.index(current)]
+        if not older:
+            raise ValueError(f"No version older than {current} to roll back to")
+        version = older[-1]
+    elif version not in versions:
+        raise ValueError(f"Unknown index version: {version}")
+
+    set_current_collection(version, pointer_file)
+    return version
+
+
+def prune_versions(
+    keep: int,
+    persist_directory: Optional[Path] = None,
+    pointer_file: Path = CURRENT_INDEX_FILE,
+) -> list[str]:
+    """
+    Delete old versions, keeping the newest ``keep`` and always the current one.
+
+    Returns:
+        Names of the deleted collections
+    """
+    if persist_directory is None:
+        persist_directory = CHROMA_DB_DIR
+
+    current = get_current_collection(pointer_file)
+    versions = list_versions(persist_directory)
+    stale = [v for v in versions[: max(len(versions) - keep, 0)] if v != current]
+
+    client = chromadb.PersistentClient(path=str(persist_directory))
+    for name in stale:
+        client.delete_collection(name)
+        print(f"Pruned index version: {name}")
+
+    return stale
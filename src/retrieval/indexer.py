@@ -1,19 +1,42 @@
 """Indexing pipeline to build the vector store from documents."""
 
+from typing import Optional
+
+from src.config import INDEX_SMOKE_QUERIES, INDEX_VERSIONS_TO_KEEP
 from src.ingestion.pipeline import load_chunks, run_ingestion_pipeline
-from src.retrieval.vector_store import add_documents, clear_vector_store, get_vector_store
+from src.retrieval.index_versions import (
+    get_current_collection,
+    list_versions,
+    new_version_name,
+    prune_versions,
+    rollback,
+    set_current_collection,
+)
+from src.retrieval.vector_store import (
+    add_documents,
+    clear_vector_store,
+    get_vector_store,
+    similarity_search,
+)
 
 
 def build_index(
     force_reprocess: bool = False,
-    clear_existing: bool = True,
-) -> None:
+    keep_versions: int = INDEX_VERSIONS_TO_KEEP,
+) -> Optional[str]:
     """
-    Build the vector store index from HR documents.
+    Build a new index version from HR documents and make it current.
+
+    The new version is written to its own collection and validated before
+    the current pointer is swapped, so running workers never see a
+    half-built index.
 
     Args:
         force_reprocess: If True, re-run document ingestion even if chunks exist
-        clear_existing: If True, clear existing vector store before indexing
+        keep_versions: Number of index versions to keep after the swap
+
+    Returns:
+        The new collection name, or None if nothing was indexed
     """
     print("=" * 50)
     print("Building Vector Store Index")
@@ -21,10 +44,10 @@ def build_index(
 
     # Step 1: Get or create chunks
     if force_reprocess:
-        print("\n[1/2] Processing documents...")
+        print("\n[1/3] Processing documents...")
         chunks = run_ingestion_pipeline()
     else:
-        print("\n[1/2] Loading processed chunks...")
+        print("\n[1/3] Loading processed chunks...")
         chunks = load_chunks()
 
         if not chunks:
@@ -33,20 +56,71 @@ def build_index(
 
     if not chunks:
         print("No documents to index!")
-        return
+        return None
 
-    # Step 2: Build vector store
-    print(f"\n[2/2] Indexing {len(chunks)} chunks...")
+    # Step 2: Build a new version alongside the live one
+    collection_name = new_version_name()
+    print(f"\n[2/3] Indexing {len(chunks)} chunks into {collection_name}...")
 
-    if clear_existing:
-        clear_vector_store()
-
-    add_documents(chunks)
+    try:
+        add_documents(chunks, collection_name=collection_name)
+    except Exception:
+        clear_vector_store(collection_name)
+        raise
+
+    # Step 3: Validate, then swap the current pointer
+    print("\n[3/3] Validating new index version...")
+    errors = validate_index(collection_name, expected_count=len(chunks))
+    if errors:
+        clear_vector_store(collection_name)
+        raise RuntimeError(
+            f"Index validation failed for {collection_name}: " + "; ".join(errors)
+        )
+
+    set_current_collection(collection_name)
+    prune_versions(keep=keep_versions)
 
     print("\n" + "=" * 50)
     print("Index build complete!")
     print("=" * 50)
 
+    return collection_name
+
+
+def validate_index(
+    collection_name: str,
+    expected_count: int,
+    smoke_queries: Optional[list[str]] = None,
+) -> list[str]:
+    """
+    Check a built index before it goes live.
+
+    Args:
+        collection_name: Collection to validate
+        expected_count: Number of chunks that were indexed
+        smoke_queries: Queries that must each return at least one result
+
+    Returns:
+        List of validation errors (empty if the index is valid)
+    """
+    if smoke_queries is None:
+        smoke_queries = INDEX_SMOKE_QUERIES
+
+    errors = []
+
+    count = get_vector_store(collection_name)._collection.count()
+    if count != expected_count:
+        errors.append(f"expected {expected_count} documents, found {count}")
+
+    for query in smoke_queries:
+        try:
+            if not similarity_search(query, k=1, collection_name=collection_name):
+                errors.append(f"no results for smoke query {query!r}")
+        except Exception as e:
+            errors.append(f"smoke query {query!r} failed: {e}")
+
+    return errors
+
 
 def get_index_stats() -> dict:
     """Get statistics about the current index."""
@@ -57,7 +131,7 @@ def get_index_stats() -> dict:
 
         return {
             "document_count": count,
-            "collection_name": "hr_documents",
+            "collection_name": collection.name,
         }
     except Exception as e:
         return {"error": str(e)}
@@ -66,8 +140,23 @@ def get_index_stats() -> dict:
 if __name__ == "__main__":
     import sys
 
-    force = "--force" in sys.argv
-    build_index(force_reprocess=force)
+    if "--rollback" in sys.argv:
+        rollback()
+    elif "--prune" in sys.argv:
+        prune_versions(keep=INDEX_VERSIONS_TO_KEEP)
+    elif "--list" in sys.argv:
+        current = get_current_collection()
+        for version in list_versions():
+            marker = "*" if version == current else " "
+            print(f"{marker} {version}")
+    else:
+        force = "--force" in sys.argv
+        build_index(force_reprocess=force)
+
+        if "--precompute" in sys.argv:
+            from src.generation.answer_cache import precompute_answers
+
+            precompute_answers()
 
     print("\n--- Index Stats ---")
     stats = get_index_stats()
@@ -0,0 +1,288 @@
+"""ONNX Runtime embedding backend for the local sentence-transformers model.
+
+Runs an exported (optionally int8-quantized) copy of LOCAL_EMBEDDING_MODEL
+without importing torch. Concurrent query encodes are batched together and
+documents are bucketed by token length when indexing.
+
+Usage:
+    python -m src.retrieval.onnx_embeddings export [--quantize]
+    python -m src.retrieval.onnx_embeddings validate [--quantize]
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from src.config import (
+    EMBEDDING_BATCH_SIZE,
+    LOCAL_EMBEDDING_MODEL,
+    ONNX_MAX_SEQ_LENGTH,
+    ONNX_MODEL_DIR,
+    ONNX_NUM_THREADS,
+    ONNX_QUANTIZED,
+    QUERY_BATCH_SIZE,
+    QUERY_BATCH_WAIT_MS,
+)
+
+MODEL_FILE = "model.onnx"
+QUANTIZED_MODEL_FILE = "model_quantized.onnx"
+TOKENIZER_FILE = "tokenizer.json"
+
+VALIDATION_TEXTS = [
+    "What is the vacation policy?",
+    "How does profit sharing work?",
+    "What benefits does the company offer?",
+    "How do I request a new laptop?",
+    "How many sick days do part-time employees get?",
+    "What is the 401k match?",
+]
+
+
+class _QueryBatcher:
+    """Collect concurrent single-text encodes into one model call."""
+
+    def __init__(
+        self,
+        encode_fn: Callable[[list[str]], np.ndarray],
+        max_batch_size: int = QUERY_BATCH_SIZE,
+        max_wait_ms: float = QUERY_BATCH_WAIT_MS,
+    ):
+        self._encode_fn = encode_fn
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, text: str) -> list[float]:
+        """Encode a single text, sharing a batch with concurrent callers."""
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future.result()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._max_wait
+
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        batch.append(self._queue.get(timeout=remaining))
+                    else:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                vectors = self._encode_fn([text for text, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), vector in zip(batch, vectors):
+                future.set_result(vector.tolist())
+
+
+class OnnxEmbeddings(Embeddings):
+    """Sentence-transformers compatible embeddings served by onnxruntime."""
+
+    def __init__(
+        self,
+        model_dir: Path = ONNX_MODEL_DIR,
+        quantized: bool = ONNX_QUANTIZED,
+        num_threads: int = ONNX_NUM_THREADS,
+        batch_size: int = EMBEDDING_BATCH_SIZE,
+        max_seq_length: int = ONNX_MAX_SEQ_LENGTH,
+    ):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        model_file = model_dir / (QUANTIZED_MODEL_FILE if quantized else MODEL_FILE)
+        if not model_file.exists():
+            raise FileNotFoundError(
+                f"No ONNX model at {model_file}. "
+                "Run: python -m src.retrieval.onnx_embeddings export"
+                + (" --quantize" if quantized else "")
+            )
+
+        options = ort.SessionOptions()
+        if num_threads > 0:
+            options.intra_op_num_threads = num_threads
+            options.inter_op_num_threads = 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+        self._session = ort.InferenceSession(
+            str(model_file),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self._input_names = {i.name for i in self._session.get_inputs()}
+
+        self._tokenizer = Tokenizer.from_file(str(model_dir / TOKENIZER_FILE))
+        self._tokenizer.no_padding()
+        self._tokenizer.enable_truncation(max_length=max_seq_length)
+
+        self._batch_size = batch_size
+        self._batcher = _QueryBatcher(self._encode)
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        """Tokenize, run the model and mean-pool one padded batch."""
+        encodings = self._tokenizer.encode_batch(texts)
+        max_len = max(len(e.ids) for e in encodings)
+
+        input_ids = np.zeros((len(encodings), max_len), dtype=np.int64)
+        attention_mask = np.zeros((len(encodings), max_len), dtype=np.int64)
+        for row, encoding in enumerate(encodings):
+            length = len(encoding.ids)
+            input_ids[row, :length] = encoding.ids
+            attention_mask[row, :length] = 1
+
+        inputs = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            inputs["token_type_ids"] = np.zeros_like(input_ids)
+
+        token_embeddings = self._session.run(None, inputs)[0]
+
+        # Mean pooling over real tokens, then L2-normalize
+        mask = attention_mask[:, :, None].astype(np.float32)
+        pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return pooled / np.clip(norms, 1e-12, None)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed documents in batches of similar token length."""
+        if not texts:
+            return []
+
+        # Sort by length so each batch pads to a similar size
+        lengths = [len(e.ids) for e in self._tokenizer.encode_batch(texts)]
+        order = sorted(range(len(texts)), key=lambda i: lengths[i])
+
+        vectors: list[Optional[list[float]]] = [None] * len(texts)
+        for start in range(0, len(order), self._batch_size):
+            indices = order[start : start + self._batch_size]
+            batch_vectors = self._encode([texts[i] for i in indices])
+            for i, vector in zip(indices, batch_vectors):
+                vectors[i] = vector.tolist()
+
+        return vectors
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a query, batching with any concurrent queries."""
+        return self._batcher.submit(text)
+
+
+def export_onnx_model(
+    model_dir: Path = ONNX_MODEL_DIR,
+    quantize: bool = False,
+) -> Path:
+    """
+    Export LOCAL_EMBEDDING_MODEL to ONNX (requires torch and optimum).
+
+    Args:
+        model_dir: Directory to write the model and tokenizer to
+        quantize: If True, also write a dynamic int8-quantized model
+
+    Returns:
+        Path to the model file the backend will load
+    """
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from transformers import AutoTokenizer
+
+    model_id = f"sentence-transformers/{LOCAL_EMBEDDING_MODEL}"
+    model_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"Exporting {model_id} to {model_dir}...")
+    model = ORTModelForFeatureExtraction.from_pretrained(model_id, export=True)
+    model.save_pretrained(model_dir)
+    AutoTokenizer.from_pretrained(model_id).save_pretrained(model_dir)
+
+    model_file = model_dir / MODEL_FILE
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        print("Quantizing to int8...")
+        quantize_dynamic(
+            str(model_file),
+            str(model_dir / QUANTIZED_MODEL_FILE),
+            weight_type=QuantType.QInt8,
+        )
+        model_file = model_dir / QUANTIZED_MODEL_FILE
+
+    print(f"Saved ONNX model to {model_file}")
+    return model_file
+
+
+def validate_onnx_embeddings(
+    texts: Optional[list[str]] = None,
+    quantized: bool = ONNX_QUANTIZED,
+) -> dict:
+    """
+    Compare ONNX vectors against the PyTorch sentence-transformers vectors.
+
+    Args:
+        texts: Texts to embed; defaults to indexed chunks plus sample questions
+        quantized: Validate the quantized model instead of the full one
+
+    Returns:
+        Dict with mean/min cosine similarity and timings
+    """
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    if texts is None:
+        from src.ingestion.pipeline import load_chunks
+
+        texts = [c.page_content for c in load_chunks()[:200]] + VALIDATION_TEXTS
+
+    torch_model = HuggingFaceEmbeddings(
+        model_name=LOCAL_EMBEDDING_MODEL,
+        model_kwargs={"device": "cpu"},
+        encode_kwargs={"normalize_embeddings": True},
+    )
+    onnx_model = OnnxEmbeddings(quantized=quantized)
+
+    start = time.perf_counter()
+    torch_vectors = np.array(torch_model.embed_documents(texts))
+    torch_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    onnx_vectors = np.array(onnx_model.embed_documents(texts))
+    onnx_seconds = time.perf_counter() - start
+
+    # Both sets are normalized, so the row-wise dot product is the cosine
+    cosines = (torch_vectors * onnx_vectors).sum(axis=1)
+
+    return {
+        "texts": len(texts),
+        "quantized": quantized,
+        "mean_cosine": float(cosines.mean()),
+        "min_cosine": float(cosines.min()),
+        "torch_seconds": round(torch_seconds, 3),
+        "onnx_seconds": round(onnx_seconds, 3),
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    quantize = "--quantize" in sys.argv
+
+    if "export" in sys.argv:
+        export_onnx_model(quantize=quantize)
+    elif "validate" in sys.argv:
+        report = validate_onnx_embeddings(quantized=quantize)
+        print("\n--- ONNX Validation ---")
+        for key, value in report.items():
+            print(f"{key}: {value}")
+    else:
+        print(__doc__)
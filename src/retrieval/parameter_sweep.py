@@ -0,0 +1,312 @@
+"""Sweep chunking and retrieval settings against a labeled question set.
+
+For every (chunk_size, chunk_overlap) pair a temporary index is built in its
+own process; every k is then scored on it. Chunk and query embeddings are
+computed once in the parent process and cached on disk by content hash, so
+chunks shared between variants (and between runs) are only embedded once.
+
+The benchmark file is a JSON list of {"question", "expected_source"} entries,
+where expected_source is a document's file name (the .md/.txt extension is
+optional).
+
+Usage:
+    python -m src.retrieval.parameter_sweep [--benchmark questions.json]
+        [--chunk-sizes 500 1000 1500] [--overlaps 0 100 200] [--k 3 5 8]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from langchain_core.documents import Document
+
+from src.config import (
+    BENCHMARK_FILE,
+    CHUNK_OVERLAP,
+    CHUNK_SIZE,
+    EMBEDDING_BACKEND,
+    LOCAL_EMBEDDING_MODEL,
+    ONNX_QUANTIZED,
+    PROCESSED_DATA_DIR,
+    TOP_K_RESULTS,
+)
+from src.ingestion.deduplication import chunk_sources, source_name
+
+# Vectors differ between backends (and between fp32 and int8 ONNX), so each gets its own cache
+_EMBEDDING_VARIANT = (
+    f"{EMBEDDING_BACKEND}_int8" if EMBEDDING_BACKEND == "onnx" and ONNX_QUANTIZED
+    else EMBEDDING_BACKEND
+)
+EMBEDDING_CACHE_FILE = (
+    PROCESSED_DATA_DIR / f"embedding_cache_{LOCAL_EMBEDDING_MODEL}_{_EMBEDDING_VARIANT}.json"
+)
+EMBED_TIMING_SAMPLE = 32  # chunks embedded per variant to estimate embedding cost
+
+DEFAULT_CHUNK_SIZES = [500, CHUNK_SIZE, 1500]
+DEFAULT_OVERLAPS = [0, 100, CHUNK_OVERLAP]
+DEFAULT_KS = [3, TOP_K_RESULTS, 8]
+
+
+def _content_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def embed_with_cache(
+    texts: list[str],
+    cache_file: Path = EMBEDDING_CACHE_FILE,
+) -> dict[str, list[float]]:
+    """
+    Embed texts, reusing vectors cached from earlier sweeps.
+
+    Returns:
+        Mapping of content hash to embedding for every text
+    """
+    from src.retrieval.embeddings import get_embedding_model
+
+    cache: dict[str, list[float]] = {}
+    if cache_file.exists():
+        with open(cache_file) as f:
+            cache = json.load(f)
+
+    missing = {_content_hash(t): t for t in texts if _content_hash(t) not in cache}
+    if missing:
+        print(f"Embedding {len(missing)} new texts ({len(cache)} cached)...")
+        vectors = get_embedding_model().embed_documents(list(missing.values()))
+        cache.update(zip(missing.keys(), vectors))
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w") as f:
+            json.dump(cache, f)
+
+    return {_content_hash(t): cache[_content_hash(t)] for t in texts}
+
+
+def estimate_embedding_seconds(
+    texts: list[str],
+    sample_size: int = EMBED_TIMING_SAMPLE,
+) -> float:
+    """
+    Estimate how long embedding all texts would take without the cache.
+
+    Times a fresh embed of an evenly spaced sample and scales it up, since
+    chunk length (and so cost) differs between chunking settings.
+    """
+    from src.retrieval.embeddings import get_embedding_model
+
+    if not texts:
+        return 0.0
+
+    step = max(len(texts) // sample_size, 1)
+    sample = texts[::step][:sample_size]
+
+    start = time.perf_counter()
+    get_embedding_model().embed_documents(sample)
+    return (time.perf_counter() - start) / len(sample) * len(texts)
+
+
+def _directory_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def _evaluate_variant(
+    chunk_size: int,
+    chunk_overlap: int,
+    chunks: list[dict],
+    chunk_vectors: list[list[float]],
+    benchmark: list[dict],
+    query_vectors: list[list[float]],
+    ks: list[int],
+    embed_seconds: float,
+) -> list[dict]:
+    """Build a temporary index for one chunking setting and score every k."""
+    import chromadb
+
+    from src.generation.prompts import RAG_PROMPT
+    from src.generation.rag_chain import format_docs
+
+    with tempfile.TemporaryDirectory(prefix="hr_sweep_") as tmp_dir:
+        client = chromadb.PersistentClient(path=tmp_dir)
+        collection = client.create_collection("sweep")
+
+        start = time.perf_counter()
+        batch_size = 100
+        for i in range(0, len(chunks), batch_size):
+            batch = chunks[i : i + batch_size]
+            collection.add(
+                ids=[str(j) for j in range(i, i + len(batch))],
+                documents=[c["content"] for c in batch],
+                metadatas=[c["metadata"] for c in batch],
+                embeddings=chunk_vectors[i : i + batch_size],
+            )
+        insert_seconds = time.perf_counter() - start
+        index_bytes = _directory_size(Path(tmp_dir))
+
+        results = []
+        for k in ks:
+            recall_hits = 0
+            reciprocal_ranks = 0.0
+            latencies = []
+            prompt_chars = 0
+
+            for item, query_vector in zip(benchmark, query_vectors):
+                start = time.perf_counter()
+                found = collection.query(
+                    query_embeddings=[query_vector],
+                    n_results=min(k, len(chunks)),
+                    include=["documents", "metadatas"],
+                )
+                latencies.append(time.perf_counter() - start)
+
+                metadatas = found["metadatas"][0]
+                for rank, metadata in enumerate(metadatas, start=1):
+                    if source_name(item["expected_source"]) in chunk_sources(metadata):
+                        recall_hits += 1
+                        reciprocal_ranks += 1 / rank
+                        break
+
+                docs = [
+                    Document(page_content=content, metadata=metadata)
+                    for content, metadata in zip(found["documents"][0], metadatas)
+                ]
+                prompt = RAG_PROMPT.format(context=format_docs(docs), question=item["question"])
+                prompt_chars += len(prompt)
+
+            count = len(benchmark)
+            latencies.sort()
+            results.append({
+                "chunk_size": chunk_size,
+                "chunk_overlap": chunk_overlap,
+                "k": k,
+                "chunks": len(chunks),
+                "recall@k": recall_hits / count,
+                "mrr": reciprocal_ranks / count,
+                "index_mb": round(index_bytes / 1e6, 2),
+                # Vectors come from the cache here; embedding is estimated separately
+                "embed_seconds_est": round(embed_seconds, 2),
+                "insert_seconds": round(insert_seconds, 2),
+                "build_seconds_est": round(embed_seconds + insert_seconds, 2),
+                "query_ms_p50": round(latencies[count // 2] * 1000, 2),
+                # ~4 characters per token for English prompt text
+                "prompt_tokens_est": prompt_chars // count // 4,
+            })
+
+    return results
+
+
+def run_sweep(
+    benchmark_file: Path = BENCHMARK_FILE,
+    chunk_sizes: Optional[list[int]] = None,
+    overlaps: Optional[list[int]] = None,
+    ks: Optional[list[int]] = None,
+    max_workers: Optional[int] = None,
+) -> list[dict]:
+    """
+    Score every chunking and k setting against the labeled questions.
+
+    Args:
+        benchmark_file: JSON list of {"question", "expected_source"} entries
+        chunk_sizes: Chunk sizes (characters) to try
+        overlaps: Chunk overlaps (characters) to try
+        ks: Numbers of retrieved chunks to try
+        max_workers: Processes building variants in parallel
+
+    Returns:
+        One result dict per (chunk_size, chunk_overlap, k)
+    """
+    from src.ingestion.deduplication import deduplicate_chunks
+    from src.ingestion.document_loader import load_all_documents
+    from src.ingestion.text_processor import chunk_markdown_by_headers, enrich_metadata
+
+    chunk_sizes = chunk_sizes or DEFAULT_CHUNK_SIZES
+    overlaps = overlaps or DEFAULT_OVERLAPS
+    ks = sorted(ks or DEFAULT_KS)
+
+    with open(benchmark_file) as f:
+        benchmark = json.load(f)
+
+    if not benchmark:
+        raise ValueError(f"No labeled questions in {benchmark_file}")
+
+    documents = enrich_metadata(load_all_documents())
+
+    # Chunk every variant up front so embeddings can be shared between them
+    variants = []
+    for chunk_size in chunk_sizes:
+        for chunk_overlap in overlaps:
+            if chunk_overlap >= chunk_size:
+                continue
+            chunks = deduplicate_chunks(
+                chunk_markdown_by_headers(documents, chunk_size, chunk_overlap)
+            )
+            variants.append((chunk_size, chunk_overlap, chunks))
+
+    all_texts = [c.page_content for _, _, chunks in variants for c in chunks]
+    questions = [item["question"] for item in benchmark]
+    vectors = embed_with_cache(all_texts)
+
+    from src.retrieval.embeddings import get_embedding_model
+
+    query_vectors = get_embedding_model().embed_documents(questions)
+
+    print("Timing embedding cost per variant...")
+    embed_seconds = [
+        estimate_embedding_seconds([c.page_content for c in chunks])
+        for _, _, chunks in variants
+    ]
+
+    print(f"Evaluating {len(variants)} chunking variants x {len(ks)} k values...")
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = [
+            executor.submit(
+                _evaluate_variant,
+                chunk_size,
+                chunk_overlap,
+                [{"content": c.page_content, "metadata": c.metadata} for c in chunks],
+                [vectors[_content_hash(c.page_content)] for c in chunks],
+                benchmark,
+                query_vectors,
+                ks,
+                variant_embed_seconds,
+            )
+            for (chunk_size, chunk_overlap, chunks), variant_embed_seconds in zip(
+                variants, embed_seconds
+            )
+        ]
+        for future in futures:
+            results.extend(future.result())
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--benchmark", type=Path, default=BENCHMARK_FILE)
+    parser.add_argument("--chunk-sizes", type=int, nargs="+")
+    parser.add_argument("--overlaps", type=int, nargs="+")
+    parser.add_argument("--k", type=int, nargs="+")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--output", type=Path, help="Also write results as JSON")
+    args = parser.parse_args()
+
+    rows = run_sweep(args.benchmark, args.chunk_sizes, args.overlaps, args.k, args.workers)
+
+    columns = list(rows[0].keys()) if rows else []
+    print("\n" + "  ".join(f"{c:>14}" for c in columns))
+    for row in rows:
+        cells = [
+            f"{row[c]:>14.3f}" if isinstance(row[c], float) else f"{row[c]:>14}"
+            for c in columns
+        ]
+        print("  ".join(cells))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(rows, f, indent=2)
+        print(f"\nSaved results to {args.output}")
@@ -9,22 +9,33 @@ from langchain_core.documents import Document
 
 from src.config import CHROMA_DB_DIR, TOP_K_RESULTS
 from src.retrieval.embeddings import get_embedding_model
+from src.retrieval.index_versions import get_current_collection
+
+# (collection name, store) for the current index version, replaced whole on a swap
+_current_store: Optional[tuple[str, Chroma]] = None
 
 
 def get_vector_store(
-    collection_name: str = "hr_documents",
+    collection_name: Optional[str] = None,
     persist_directory: Optional[Path] = None,
 ) -> Chroma:
     """
     Get or create a ChromaDB vector store.
 
     Args:
-        collection_name: Name of the collection in ChromaDB
+        collection_name: Name of the collection in ChromaDB; defaults to
+            the current index version
         persist_directory: Directory to persist the database
 
     Returns:
         Chroma vector store instance
     """
+    if collection_name is None and persist_directory is None:
+        return _get_current_vector_store()
+
+    if collection_name is None:
+        collection_name = get_current_collection()
+
     if persist_directory is None:
         persist_directory = CHROMA_DB_DIR
 
@@ -39,16 +50,34 @@ def get_vector_store(
     )
 
 
+def _get_current_vector_store() -> Chroma:
+    """Get the cached store for the current version, reopening it after a swap."""
+    global _current_store
+
+    collection_name = get_current_collection()
+    current = _current_store
+    if current is not None and current[0] == collection_name:
+        return current[1]
+
+    # Open the new version without a lock; queries keep using the old handle
+    # until the reference below is replaced
+    store = get_vector_store(collection_name, CHROMA_DB_DIR)
+    _current_store = (collection_name, store)
+    print(f"Loaded index version: {collection_name}")
+
+    return store
+
+
 def add_documents(
     documents: list[Document],
-    collection_name: str = "hr_documents",
+    collection_name: Optional[str] = None,
 ) -> Chroma:
     """
     Add documents to the vector store.
 
     Args:
         documents: List of Document objects to add
-        collection_name: Name of the collection
+        collection_name: Name of the collection (defaults to current version)
 
     Returns:
         The vector store with added documents
@@ -69,7 +98,7 @@ def add_documents(
 def similarity_search(
     query: str,
     k: int = TOP_K_RESULTS,
-    collection_name: str = "hr_documents",
+    collection_name: Optional[str] = None,
     filter_dict: Optional[dict] = None,
 ) -> list[Document]:
     """
@@ -78,7 +107,7 @@ def similarity_search(
     Args:
         query: Search query string
         k: Number of results to return
-        collection_name: Name of the collection to search
+        collection_name: Name of the collection to search (defaults to current version)
         filter_dict: Optional metadata filter
 
     Returns:
@@ -97,7 +126,7 @@ def similarity_search(
 def similarity_search_with_scores(
     query: str,
     k: int = TOP_K_RESULTS,
-    collection_name: str = "hr_documents",
+    collection_name: Optional[str] = None,
 ) -> list[tuple[Document, float]]:
     """
     Search for similar documents with relevance scores.
@@ -105,7 +134,7 @@ def similarity_search_with_scores(
     Args:
         query: Search query string
         k: Number of results to return
-        collection_name: Name of the collection to search
+        collection_name: Name of the collection to search (defaults to current version)
 
     Returns:
         List of (document, score) tuples
@@ -114,16 +143,36 @@ def similarity_search_with_scores(
     return vector_store.similarity_search_with_score(query, k=k)
 
 
+def similarity_search_by_vector_with_scores(
+    embedding: list[float],
+    k: int = TOP_K_RESULTS,
+    collection_name: Optional[str] = None,
+) -> list[tuple[Document, float]]:
+    """
+    Search for similar documents using an already computed query embedding.
+
+    Args:
+        embedding: Query embedding from the configured embedding model
+        k: Number of results to return
+        collection_name: Name of the collection to search (defaults to current version)
+
+    Returns:
+        List of (document, score) tuples
+    """
+    vector_store = get_vector_store(collection_name)
+    return vector_store.similarity_search_by_vector_with_relevance_scores(embedding, k=k)
+
+
 def get_retriever(
     k: int = TOP_K_RESULTS,
-    collection_name: str = "hr_documents",
+    collection_name: Optional[str] = None,
 ):
     """
     Get a retriever for use in RAG chains.
 
     Args:
         k: Number of documents to retrieve
-        collection_name: Name of the collection
+        collection_name: Name of the collection (defaults to current version)
 
     Returns:
         A retriever instance
@@ -135,8 +184,16 @@ def get_retriever(
     )
 
 
-def clear_vector_store(collection_name: str = "hr_documents") -> None:
+def clear_vector_store(collection_name: Optional[str] = None) -> None:
     """Delete all documents from the vector store."""
+    global _current_store
+
+    if collection_name is None:
+        collection_name = get_current_collection()
+
+    if _current_store is not None and _current_store[0] == collection_name:
+        _current_store = None
+
     client = chromadb.PersistentClient(path=str(CHROMA_DB_DIR))
     try:
         client.delete_collection(collection_name)
@@ -0,0 +1,68 @@
+"""Tests for follow-up detection and question condensing."""
+
+import pytest
+
+from src.generation.conversation import (
+    ConversationSession,
+    condense_question,
+    is_follow_up,
+)
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "Is there a dress code?",
+        "Is there a 401k match?",
+        "How do I submit this form?",
+        "For how long is parental leave?",
+        "What is the vacation policy?",
+    ],
+)
+def test_standalone_questions_are_not_follow_ups(question):
+    assert not is_follow_up(question)
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "and for part-time employees?",
+        "What about contractors?",
+        "Does that apply to interns?",
+        "Why is that?",
+        "How many?",
+    ],
+)
+def test_follow_ups_are_detected(question):
+    assert is_follow_up(question)
+
+
+def _session(*questions: str) -> ConversationSession:
+    session = ConversationSession()
+    session.questions.extend(questions)
+    return session
+
+
+def test_condense_joins_follow_up_to_previous_question():
+    session = _session("What is the vacation policy?")
+    assert condense_question(session, "and for part-time employees?") == (
+        "What is the vacation policy? and for part-time employees?"
+    )
+
+
+def test_condense_leaves_standalone_question_alone():
+    session = _session("What is the vacation policy?")
+    assert condense_question(session, "Is there a 401k match?") == "Is there a 401k match?"
+
+
+def test_condense_chains_follow_ups_to_last_standalone_question():
+    session = _session("What is the vacation policy?", "and for part-time employees?")
+    assert condense_question(session, "what about contractors?") == (
+        "What is the vacation policy? what about contractors?"
+    )
+
+
+def test_condense_without_history():
+    assert condense_question(_session(), "and for part-time employees?") == (
+        "and for part-time employees?"
+    )
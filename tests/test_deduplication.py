@@ -0,0 +1,83 @@
+"""Tests for near-duplicate chunk removal."""
+
+from langchain_core.documents import Document
+
+from src.ingestion.deduplication import (
+    chunk_sources,
+    deduplicate_chunks,
+    find_duplicate_clusters,
+    minhash_signatures,
+    source_name,
+)
+
+# ~150 distinct-ish words so a one-word edit keeps Jaccard well above 0.85
+DISCLAIMER = " ".join(
+    f"clause{i} this handbook does not create a contract of employment section{i}"
+    for i in range(15)
+)
+UNRELATED = " ".join(f"laptop{i} requests go through the IT portal ticket{i}" for i in range(15))
+
+
+def _chunk(text: str, filename: str) -> Document:
+    return Document(page_content=text, metadata={"filename": filename, "category": "policies"})
+
+
+def test_exact_copies_cluster():
+    signatures = minhash_signatures([DISCLAIMER, UNRELATED, DISCLAIMER])
+    assert sorted(find_duplicate_clusters(signatures)) == [[0, 2], [1]]
+
+
+def test_near_copy_above_threshold_clusters():
+    near_copy = DISCLAIMER.replace("clause7", "paragraph7")
+    signatures = minhash_signatures([DISCLAIMER, near_copy])
+    assert find_duplicate_clusters(signatures, threshold=0.85) == [[0, 1]]
+
+
+def test_near_copy_below_threshold_stays_separate():
+    words = DISCLAIMER.split()
+    half_rewritten = " ".join(words[: len(words) // 2] + UNRELATED.split()[len(words) // 2 :])
+    signatures = minhash_signatures([DISCLAIMER, half_rewritten])
+    assert find_duplicate_clusters(signatures, threshold=0.85) == [[0], [1]]
+
+
+def test_many_copies_form_one_cluster():
+    signatures = minhash_signatures([DISCLAIMER] * 50 + [UNRELATED])
+    clusters = find_duplicate_clusters(signatures)
+    assert sorted(len(c) for c in clusters) == [1, 50]
+
+
+def test_deduplicate_keeps_longest_and_merges_sources():
+    chunks = [
+        _chunk(DISCLAIMER, "handbook_us"),
+        _chunk(UNRELATED, "device_policy"),
+        _chunk(DISCLAIMER + " see HR", "handbook_uk"),
+        _chunk(DISCLAIMER, "handbook_ca"),
+    ]
+
+    result = deduplicate_chunks(chunks)
+
+    assert [c.metadata["filename"] for c in result] == ["device_policy", "handbook_uk"]
+    canonical = result[1]
+    assert canonical.page_content == DISCLAIMER + " see HR"
+    assert canonical.metadata["duplicate_count"] == 2
+    assert canonical.metadata["duplicate_sources"] == "handbook_ca, handbook_uk, handbook_us"
+    assert "duplicate_count" not in result[0].metadata
+    # The input chunk's metadata is not modified
+    assert "duplicate_sources" not in chunks[2].metadata
+
+
+def test_deduplicate_empty():
+    assert deduplicate_chunks([]) == []
+
+
+def test_chunk_sources_includes_merged_duplicates():
+    assert chunk_sources({"filename": "handbook_us"}) == {"handbook_us"}
+    assert chunk_sources(
+        {"filename": "handbook_uk", "duplicate_sources": "handbook_ca, handbook_uk"}
+    ) == {"handbook_ca", "handbook_uk"}
+
+
+def test_source_name_drops_document_extension():
+    assert source_name("vacation_policy.md") == "vacation_policy"
+    assert source_name("benefits.TXT") == "benefits"
+    assert source_name("vacation_policy") == "vacation_policy"
@@ -0,0 +1,85 @@
+"""Tests for the extractive answer fast path."""
+
+from langchain_core.documents import Document
+
+from src.generation.extractive import (
+    extract_sentences,
+    extractive_answer,
+    is_confident,
+    split_sentences,
+)
+
+CHUNK = Document(
+    page_content=(
+        "## 401(k) Plan\n"
+        "The company matches 100% of contributions up to 4% of salary. "
+        "Matching contributions vest immediately.\n"
+        "- Enrollment opens on your first day."
+    ),
+    metadata={"filename": "benefits_guide"},
+)
+OTHER = Document(page_content="Vacation accrues monthly.", metadata={"filename": "leave_policy"})
+
+
+def test_is_confident_accepts_top_distance_at_limit():
+    assert is_confident([(CHUNK, 0.5), (OTHER, 0.9)], max_distance=0.5, min_margin=0.1)
+
+
+def test_is_confident_rejects_top_distance_over_limit():
+    assert not is_confident([(CHUNK, 0.51), (OTHER, 0.9)], max_distance=0.5, min_margin=0.1)
+
+
+def test_is_confident_accepts_margin_at_limit():
+    assert is_confident([(CHUNK, 0.5), (OTHER, 0.75)], max_distance=0.6, min_margin=0.25)
+
+
+def test_is_confident_rejects_margin_under_limit():
+    assert not is_confident([(CHUNK, 0.5), (OTHER, 0.7)], max_distance=0.6, min_margin=0.25)
+
+
+def test_is_confident_single_result_only_checks_distance():
+    assert is_confident([(CHUNK, 0.3)], max_distance=0.5, min_margin=0.25)
+    assert not is_confident([(CHUNK, 0.6)], max_distance=0.5, min_margin=0.25)
+
+
+def test_is_confident_empty_results():
+    assert not is_confident([])
+
+
+def test_split_sentences_drops_headers():
+    assert split_sentences(CHUNK.page_content) == [
+        "The company matches 100% of contributions up to 4% of salary.",
+        "Matching contributions vest immediately.",
+        "- Enrollment opens on your first day.",
+    ]
+
+
+def test_extract_sentences_keeps_best_matches_in_order():
+    answer = extract_sentences("When do matching contributions vest?", CHUNK.page_content, 2)
+    assert answer == (
+        "The company matches 100% of contributions up to 4% of salary. "
+        "Matching contributions vest immediately."
+    )
+
+
+def test_extract_sentences_stopword_only_question():
+    assert extract_sentences("What is it?", CHUNK.page_content) == ""
+
+
+def test_extractive_answer_cites_top_chunk():
+    answer = extractive_answer("Do contributions vest?", [(CHUNK, 0.2), (OTHER, 0.9)])
+    assert answer.endswith("(Source: benefits_guide)")
+    assert "vest immediately" in answer
+
+
+def test_extractive_answer_falls_back_for_stopword_only_question():
+    assert extractive_answer("What is it?", [(CHUNK, 0.2), (OTHER, 0.9)]) is None
+
+
+def test_extractive_answer_falls_back_for_header_only_chunk():
+    header_only = Document(page_content="# Benefits\n## 401(k) Plan", metadata={})
+    assert extractive_answer("What is the 401k plan?", [(header_only, 0.1)]) is None
+
+
+def test_extractive_answer_falls_back_when_not_confident():
+    assert extractive_answer("Do contributions vest?", [(CHUNK, 0.5), (OTHER, 0.55)]) is None
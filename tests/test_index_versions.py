@@ -0,0 +1,109 @@
+"""Tests for versioned index collections and the current-version pointer."""
+
+import chromadb
+import pytest
+
+from src.config import COLLECTION_NAME
+from src.retrieval.index_versions import (
+    get_current_collection,
+    list_versions,
+    prune_versions,
+    rollback,
+    set_current_collection,
+)
+
+V1 = f"{COLLECTION_NAME}_v20260101000000000000"
+V2 = f"{COLLECTION_NAME}_v20260201000000000000"
+V3 = f"{COLLECTION_NAME}_v20260301000000000000"
+
+
+@pytest.fixture
+def chroma_dir(tmp_path):
+    return tmp_path / "chroma"
+
+
+@pytest.fixture
+def pointer_file(tmp_path):
+    return tmp_path / "chroma" / "current_index.json"
+
+
+def _create(chroma_dir, *names: str) -> None:
+    client = chromadb.PersistentClient(path=str(chroma_dir))
+    for name in names:
+        client.create_collection(name)
+
+
+def test_missing_pointer_falls_back_to_unversioned_collection(pointer_file):
+    assert get_current_collection(pointer_file) == COLLECTION_NAME
+
+
+def test_pointer_swap_is_seen_by_readers(pointer_file):
+    set_current_collection(V1, pointer_file)
+    assert get_current_collection(pointer_file) == V1
+
+    set_current_collection(V2, pointer_file)
+    assert get_current_collection(pointer_file) == V2
+    assert [p.name for p in pointer_file.parent.iterdir()] == [pointer_file.name]
+
+
+def test_list_versions_puts_legacy_collection_first(chroma_dir):
+    _create(chroma_dir, V2, "unrelated", COLLECTION_NAME, V1)
+    assert list_versions(chroma_dir) == [COLLECTION_NAME, V1, V2]
+
+
+def test_rollback_to_previous_version(chroma_dir, pointer_file):
+    _create(chroma_dir, V1, V2, V3)
+    set_current_collection(V3, pointer_file)
+
+    assert rollback(persist_directory=chroma_dir, pointer_file=pointer_file) == V2
+    assert get_current_collection(pointer_file) == V2
+
+
+def test_rollback_from_first_build_to_legacy_collection(chroma_dir, pointer_file):
+    _create(chroma_dir, COLLECTION_NAME, V1)
+    set_current_collection(V1, pointer_file)
+
+    assert rollback(persist_directory=chroma_dir, pointer_file=pointer_file) == COLLECTION_NAME
+    assert get_current_collection(pointer_file) == COLLECTION_NAME
+
+
+def test_rollback_to_named_version(chroma_dir, pointer_file):
+    _create(chroma_dir, V1, V2, V3)
+    set_current_collection(V3, pointer_file)
+
+    assert rollback(V1, persist_directory=chroma_dir, pointer_file=pointer_file) == V1
+
+
+def test_rollback_without_older_version_fails(chroma_dir, pointer_file):
+    _create(chroma_dir, V1)
+    set_current_collection(V1, pointer_file)
+
+    with pytest.raises(ValueError, match="No version older"):
+        rollback(persist_directory=chroma_dir, pointer_file=pointer_file)
+
+
+def test_rollback_to_unknown_version_fails(chroma_dir, pointer_file):
+    _create(chroma_dir, V1)
+
+    with pytest.raises(ValueError, match="Unknown index version"):
+        rollback(V2, persist_directory=chroma_dir, pointer_file=pointer_file)
+
+
+def test_prune_keeps_newest_versions(chroma_dir, pointer_file):
+    _create(chroma_dir, COLLECTION_NAME, V1, V2, V3)
+    set_current_collection(V3, pointer_file)
+
+    pruned = prune_versions(keep=2, persist_directory=chroma_dir, pointer_file=pointer_file)
+
+    assert pruned == [COLLECTION_NAME, V1]
+    assert list_versions(chroma_dir) == [V2, V3]
+
+
+def test_prune_never_deletes_current_version(chroma_dir, pointer_file):
+    _create(chroma_dir, V1, V2, V3)
+    set_current_collection(V1, pointer_file)
+
+    pruned = prune_versions(keep=1, persist_directory=chroma_dir, pointer_file=pointer_file)
+
+    assert pruned == [V2]
+    assert list_versions(chroma_dir) == [V1, V3]
@@ -0,0 +1,88 @@
+"""Tests for query batching and length bucketing in the ONNX backend."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.retrieval.onnx_embeddings import OnnxEmbeddings, _QueryBatcher
+
+
+def _wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError
+        time.sleep(0.001)
+
+
+def test_query_batcher_groups_concurrent_submits():
+    batch_sizes = []
+    release = threading.Event()
+
+    def encode(texts: list[str]) -> np.ndarray:
+        batch_sizes.append(len(texts))
+        if texts == ["warmup"]:
+            release.wait()
+            return np.array([[-1.0]])
+        return np.array([[float(t)] for t in texts])
+
+    batcher = _QueryBatcher(encode, max_batch_size=16, max_wait_ms=0)
+
+    with ThreadPoolExecutor(max_workers=41) as executor:
+        # Hold the worker inside the first batch while the rest queue up
+        warmup = executor.submit(batcher.submit, "warmup")
+        _wait_for(lambda: batch_sizes == [1])
+        futures = {i: executor.submit(batcher.submit, str(i)) for i in range(40)}
+        _wait_for(lambda: batcher._queue.qsize() == 40)
+        release.set()
+
+        assert warmup.result() == [-1.0]
+        for i, future in futures.items():
+            assert future.result() == [float(i)]
+
+    assert batch_sizes == [1, 16, 16, 8]
+
+
+def test_query_batcher_propagates_encode_errors():
+    def encode(texts: list[str]) -> np.ndarray:
+        raise RuntimeError("model failed")
+
+    batcher = _QueryBatcher(encode, max_batch_size=4, max_wait_ms=0)
+
+    with pytest.raises(RuntimeError, match="model failed"):
+        batcher.submit("question")
+
+
+def _fake_embeddings(batch_size: int, batches: list[list[str]]) -> OnnxEmbeddings:
+    """An OnnxEmbeddings with a whitespace tokenizer and a recording encoder."""
+
+    def encode_batch(texts: list[str]) -> list[SimpleNamespace]:
+        return [SimpleNamespace(ids=text.split()) for text in texts]
+
+    def encode(texts: list[str]) -> np.ndarray:
+        batches.append(texts)
+        return np.array([[float(len(t.split())), float(len(t))] for t in texts])
+
+    embeddings = OnnxEmbeddings.__new__(OnnxEmbeddings)
+    embeddings._tokenizer = SimpleNamespace(encode_batch=encode_batch)
+    embeddings._batch_size = batch_size
+    embeddings._encode = encode
+    return embeddings
+
+
+def test_embed_documents_buckets_by_length_and_keeps_input_order():
+    texts = ["a b c d e f", "a", "a b c d", "a b", "a b c d e", "a b c"]
+    batches: list[list[str]] = []
+
+    vectors = _fake_embeddings(batch_size=2, batches=batches).embed_documents(texts)
+
+    assert batches == [["a", "a b"], ["a b c", "a b c d"], ["a b c d e", "a b c d e f"]]
+    assert vectors == [[float(len(t.split())), float(len(t))] for t in texts]
+
+
+def test_embed_documents_empty():
+    assert _fake_embeddings(batch_size=2, batches=[]).embed_documents([]) == []